@@ -8,13 +8,19 @@ Created on Mon Sep  1 21:26:46 2025
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
+import duckdb
 import sqlite3
 import requests
+import httpx
+import orjson
 import warnings
 import time
+import threading
+import asyncio
 import os
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
 
 # Suppress InsecureRequestWarning
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
@@ -22,6 +28,11 @@ warnings.simplefilter('ignore', InsecureRequestWarning)
 
 DB_NAME = 'fpl.db'
 UPDATE_INTERVAL_HOURS = 12
+PLAYER_HISTORY_TTL_HOURS = 48
+REFRESH_RETRY_MINUTES = 10
+WRITE_LOCK_TIMEOUT_SECONDS = 300
+MAX_CONCURRENT_FETCHES = 16
+NOT_MODIFIED = object()
 
 # --- Page Config ---
 st.set_page_config(layout="wide")
@@ -29,142 +40,374 @@ st.title('FPL Tactical Analysis Dashboard ⚽')
 
 # --- Data Fetching and Database Functions ---
 
-def get_fpl_data():
-    """Fetches the main FPL bootstrap data from the official API."""
+def _connect(read_only=False):
+    """Opens a SQLite connection tuned for bulk refreshes and concurrent reads.
+
+    Read-only connections may be shared across threads; writers go through get_write_lock().
+    """
+    if read_only:
+        conn = sqlite3.connect(f"file:{DB_NAME}?mode=ro", uri=True, check_same_thread=False)
+    else:
+        conn = sqlite3.connect(DB_NAME)
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript("""
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+    """)
+    return conn
+
+@st.cache_resource
+def get_conn():
+    """Returns a long-lived read-only SQLite connection shared across reruns.
+
+    This avoids reconnecting on every rerun. Reads from different script
+    threads still take turns, since SQLite serializes use of one connection.
+    """
+    return _connect(read_only=True)
+
+@st.cache_resource
+def get_write_lock():
+    """Returns the lock serializing database refreshes across sessions and threads."""
+    return threading.Lock()
+
+@st.cache_resource
+def get_duckdb():
+    """Returns a DuckDB connection with the SQLite scanner loaded for bulk table reads."""
+    con = duckdb.connect()
+    con.execute("INSTALL sqlite; LOAD sqlite;")
+    return con
+
+@st.cache_resource
+def get_session():
+    """Returns a shared HTTP session so FPL requests reuse keep-alive connections."""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+    return session
+
+def get_fpl_data(etag=None, last_modified=None):
+    """Fetches the main FPL bootstrap data from the official API.
+
+    Sends conditional headers when validators from a previous fetch are given.
+    Returns (data, etag, last_modified); data is NOT_MODIFIED on a 304. Network,
+    HTTP and JSON errors are raised for the caller to report.
+    """
     url = "https://fantasy.premierleague.com/api/bootstrap-static/"
-    try:
-        response = requests.get(url, verify=False)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching main FPL data: {e}")
-        return None
-
-def get_player_gameweek_history(player_id):
-    """Fetches the gameweek history for a specific player."""
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    response = get_session().get(url, headers=headers, verify=False, timeout=10)
+    if response.status_code == 304:
+        return NOT_MODIFIED, etag, last_modified
+    response.raise_for_status()
+    return (orjson.loads(response.content),
+            response.headers.get('ETag'), response.headers.get('Last-Modified'))
+
+async def get_player_gameweek_history(client, semaphore, player_id):
+    """Fetches the gameweek history for a specific player as (player_id, data)."""
     url = f"https://fantasy.premierleague.com/api/element-summary/{player_id}/"
-    try:
-        response = requests.get(url, verify=False)
-        response.raise_for_status()
-        time.sleep(0.05)
-        return response.json()
-    except requests.exceptions.RequestException:
-        return None
+    async with semaphore:
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+            return player_id, orjson.loads(response.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError):
+            return player_id, None
+
+async def get_player_gameweek_histories(player_ids, progress):
+    """Fetches many player histories multiplexed over a single HTTP/2 client."""
+    limits = httpx.Limits(max_connections=32)
+    async with httpx.AsyncClient(http2=True, verify=False, timeout=10, limits=limits) as client:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        tasks = [get_player_gameweek_history(client, semaphore, pid) for pid in player_ids]
+        results = []
+        for i, task in enumerate(asyncio.as_completed(tasks)):
+            results.append(await task)
+            progress((i + 1) / len(player_ids), f"Processing player {i+1}/{len(player_ids)}")
+    return results
 
 def create_database_tables():
     """Creates the SQLite database tables if they don't exist."""
-    with sqlite3.connect(DB_NAME) as conn:
+    with _connect() as conn:
         cursor = conn.cursor()
         cursor.execute("""
         CREATE TABLE IF NOT EXISTS players (
             id INTEGER PRIMARY KEY, web_name TEXT, team_name TEXT, position TEXT,
-            cost REAL, total_points INTEGER, display_name TEXT,
-            points_per_million REAL, ownership_percent REAL
+            cost REAL, total_points INTEGER,
+            points_per_million REAL, ownership_percent REAL, last_fetched REAL
         )""")
         cursor.execute("""
         CREATE TABLE IF NOT EXISTS gameweek_history (
             player_id INTEGER, gameweek INTEGER, total_points INTEGER, minutes INTEGER,
             FOREIGN KEY (player_id) REFERENCES players (id), PRIMARY KEY (player_id, gameweek)
         )""")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_pos_team ON players (position, team_name)")
+        cursor.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
         conn.commit()
 
-def update_database():
-    """Fetches fresh data and updates the database. Shows progress in Streamlit."""
-    with sqlite3.connect(DB_NAME) as conn:
-        cursor = conn.cursor()
-        cursor.execute("DROP TABLE IF EXISTS players")
-        cursor.execute("DROP TABLE IF EXISTS gameweek_history")
-    
+def get_meta(conn, key):
+    """Returns a value from the meta table, or None if it isn't set."""
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+def set_meta(conn, key, value):
+    """Stores a value in the meta table."""
+    conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+def _fetch_player_histories(player_ids, log, progress):
+    """Fetches gameweek histories, returning (player_id, history) for each successful fetch."""
+    log(f"Updating gameweek history for {len(player_ids)} players...")
+    results = asyncio.run(get_player_gameweek_histories(player_ids, progress))
+    return [(player_id, history_data['history']) for player_id, history_data in results
+            if history_data and 'history' in history_data]
+
+def _store_player_histories(conn, player_histories):
+    """Upserts fetched gameweek histories inside the caller's transaction."""
+    rows = [(player_id, gw['round'], gw['total_points'], gw['minutes'])
+            for player_id, gw_rows in player_histories for gw in gw_rows]
+    # Bulk-load into an unindexed staging table, then merge in one statement.
+    conn.execute("CREATE TEMP TABLE _stage (player_id, gameweek, total_points, minutes)")
+    conn.executemany("INSERT INTO _stage VALUES (?, ?, ?, ?)", rows)
+    conn.execute("INSERT OR REPLACE INTO gameweek_history SELECT * FROM _stage")
+    conn.execute("DROP TABLE _stage")
+
+def refresh_database(force=False, log=None, progress=None):
+    """Runs _refresh_database while holding the database write lock.
+
+    Raises TimeoutError if another refresh holds the lock for too long.
+    """
+    write_lock = get_write_lock()
+    if not write_lock.acquire(timeout=WRITE_LOCK_TIMEOUT_SECONDS):
+        raise TimeoutError("Another database refresh is still running.")
+    try:
+        return _refresh_database(force, log, progress)
+    finally:
+        write_lock.release()
+
+def _refresh_database(force=False, log=None, progress=None):
+    """Fetches fresh data and updates the database without touching the Streamlit UI.
+
+    Unless force is set, the bootstrap request is conditional. Gameweek history
+    is only re-fetched for players whose points changed, whose last fetch failed
+    or is older than the TTL; an unchanged payload still retries the latter two.
+    log(message) and progress(fraction, text) are optional reporting callbacks.
+    Returns 'updated' or 'unchanged'; errors from get_fpl_data propagate.
+    """
+    log = log or (lambda message: None)
+    progress = progress or (lambda fraction, text: None)
     create_database_tables()
-    
-    status_message = st.status("Fetching fresh data from FPL API...", expanded=True)
-    fpl_data = get_fpl_data()
-    if not fpl_data:
-        status_message.error("Could not fetch FPL data. Aborting update.")
-        return
+    etag = last_modified = None
+    if not force:
+        with _connect() as conn:
+            etag = get_meta(conn, 'etag')
+            last_modified = get_meta(conn, 'last_modified')
+
+    fpl_data, etag, last_modified = get_fpl_data(etag, last_modified)
+    now = time.time()
+    if fpl_data is NOT_MODIFIED:
+        with _connect() as conn:
+            retry_ids = [row[0] for row in conn.execute(
+                "SELECT id FROM players WHERE last_fetched IS NULL OR last_fetched < ?",
+                (now - PLAYER_HISTORY_TTL_HOURS * 3600,))]
+        if retry_ids:
+            player_histories = _fetch_player_histories(retry_ids, log, progress)
+            with _connect() as conn:
+                conn.execute("BEGIN")
+                conn.executemany("UPDATE players SET last_fetched = ? WHERE id = ?",
+                                 [(now, player_id) for player_id, _ in player_histories])
+                _store_player_histories(conn, player_histories)
+                conn.commit()
+            st.cache_data.clear()
+        with _connect() as conn:
+            set_meta(conn, 'last_refresh', str(now))
+        return 'unchanged'
+
+    if force:
+        with _connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DROP TABLE IF EXISTS players")
+            cursor.execute("DROP TABLE IF EXISTS gameweek_history")
+        create_database_tables()
+        # A rebuild may follow a deleted DB file, so reopen the cached reader on the new one.
+        get_conn.clear()
 
-    players_df = pd.DataFrame(fpl_data['elements'])
-    teams_df = pd.DataFrame(fpl_data['teams'])
-    positions_df = pd.DataFrame(fpl_data['element_types'])
+    players_df = pd.DataFrame.from_records(fpl_data['elements'], columns=[
+        'id', 'web_name', 'team', 'element_type', 'now_cost', 'total_points', 'selected_by_percent'])
+    teams_df = pd.DataFrame.from_records(fpl_data['teams'], columns=['id', 'name'])
+    positions_df = pd.DataFrame.from_records(fpl_data['element_types'], columns=['id', 'singular_name_short'])
     team_map = teams_df.set_index('id')['name']
     position_map = positions_df.set_index('id')['singular_name_short']
     players_df['team_name'] = players_df['team'].map(team_map)
     players_df['position'] = players_df['element_type'].map(position_map)
     players_df['cost'] = players_df['now_cost'] / 10.0
-    players_df['display_name'] = players_df['web_name'] + " (" + players_df['team_name'] + ")"
     players_df['ownership_percent'] = pd.to_numeric(players_df['selected_by_percent'])
     players_df['points_per_million'] = (players_df['total_points'] / players_df['cost']).fillna(0)
 
+    with _connect() as conn:
+        stored_df = pd.read_sql_query(
+            "SELECT id, total_points AS stored_points, last_fetched FROM players", conn)
+    players_df = players_df.merge(stored_df, on='id', how='left')
+    removed_ids = [(pid,) for pid in set(stored_df['id'].tolist()) - set(players_df['id'].tolist())]
+
+    is_stale = (players_df['last_fetched'].isna()
+                | (players_df['last_fetched'] < now - PLAYER_HISTORY_TTL_HOURS * 3600)
+                | (players_df['total_points'] != players_df['stored_points']))
+    stale_ids = players_df.loc[is_stale, 'id'].tolist()
+
+    player_histories = _fetch_player_histories(stale_ids, log, progress)
+
+    # Failed fetches get a NULL timestamp so they are retried on the next update.
+    fetched = players_df['id'].isin([pid for pid, _ in player_histories])
+    players_df.loc[fetched, 'last_fetched'] = now
+    players_df.loc[is_stale & ~fetched, 'last_fetched'] = None
+    players_df['last_fetched'] = players_df['last_fetched'].astype(object).where(players_df['last_fetched'].notna(), None)
+
     players_to_db = players_df[['id', 'web_name', 'team_name', 'position', 'cost', 'total_points', 
-                                'display_name', 'points_per_million', 'ownership_percent']]
-    
-    with sqlite3.connect(DB_NAME) as conn:
-        players_to_db.to_sql('players', conn, if_exists='replace', index=False)
-        status_message.write(f"Updated {len(players_to_db)} players.")
-        
-        status_message.write("Updating gameweek history...")
-        progress_bar = st.progress(0)
-        cursor = conn.cursor()
-        all_player_ids = players_df['id'].tolist()
-        total_players = len(all_player_ids)
-
-        for i, player_id in enumerate(all_player_ids):
-            history_data = get_player_gameweek_history(player_id)
-            if history_data and 'history' in history_data:
-                for gw in history_data['history']:
-                    cursor.execute("INSERT OR REPLACE INTO gameweek_history VALUES (?, ?, ?, ?)",
-                                   (player_id, gw['round'], gw['total_points'], gw['minutes']))
-            progress_bar.progress((i + 1) / total_players, text=f"Processing player {i+1}/{total_players}")
-        
+                                'points_per_million', 'ownership_percent', 'last_fetched']]
+
+    with _connect() as conn:
+        conn.execute("BEGIN")
+        conn.executemany("INSERT OR REPLACE INTO players VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                         players_to_db.itertuples(index=False, name=None))
+        conn.executemany("DELETE FROM players WHERE id = ?", removed_ids)
+        conn.executemany("DELETE FROM gameweek_history WHERE player_id = ?", removed_ids)
+        _store_player_histories(conn, player_histories)
+        set_meta(conn, 'etag', etag)
+        set_meta(conn, 'last_modified', last_modified)
+        set_meta(conn, 'last_refresh', str(now))
         conn.commit()
-    
+        conn.execute("ANALYZE")
+        conn.execute("PRAGMA optimize")
+    log(f"Updated {len(players_to_db)} players.")
+    st.cache_data.clear()
+    return 'updated'
+
+def update_database():
+    """Rebuilds the database in the foreground, showing progress in Streamlit."""
+    status_message = st.status("Fetching fresh data from FPL API...", expanded=True)
+    progress_bar = st.progress(0)
+    try:
+        refresh_database(force=True, log=status_message.write,
+                         progress=lambda fraction, text: progress_bar.progress(fraction, text=text))
+    except TimeoutError as e:
+        status_message.error(f"{e} Aborting update.")
+        return
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+        status_message.error(f"Error fetching main FPL data: {e}. Aborting update.")
+        return
     status_message.success("Database update complete!")
     time.sleep(2)
     st.rerun()
 
+class BackgroundRefresher:
+    """Runs refresh_database on a worker thread so stale data can be served meanwhile."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread = None
+        self._last_started = None
+        self.last_error = None
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Starts a refresh unless one is running or one started within the retry window."""
+        with self._lock:
+            if self.is_running():
+                return
+            if self._last_started and datetime.now() - self._last_started < timedelta(minutes=REFRESH_RETRY_MINUTES):
+                return
+            self._last_started = datetime.now()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        # There is no script context on this thread, so failures are kept for
+        # the next rerun to show instead of being reported here.
+        try:
+            refresh_database()
+            self.last_error = None
+        except Exception as e:
+            self.last_error = e
+
+@st.cache_resource
+def get_background_refresher():
+    """Returns the refresher shared by every session of the app."""
+    return BackgroundRefresher()
+
 def check_and_update_db():
-    """Checks the database file and schema, triggering an update if needed."""
+    """Checks the database file and schema, triggering an update if needed.
+
+    A missing or outdated database is rebuilt in the foreground; a merely stale
+    one is refreshed in the background while the existing data is served.
+    """
     db_exists = os.path.exists(DB_NAME)
     if not db_exists:
         st.info("Database not found. Creating and populating a new one.")
+        get_conn.clear()
         create_database_tables()
         update_database()
         return
 
-    is_schema_correct = False
-    try:
-        with sqlite3.connect(DB_NAME) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT points_per_million FROM players LIMIT 1")
-            is_schema_correct = True
-    except sqlite3.OperationalError:
+    cols = {row[1] for row in get_conn().execute("PRAGMA table_info(players)").fetchall()}
+    is_schema_correct = {'points_per_million', 'last_fetched'} <= cols
+    if not is_schema_correct:
         st.warning("Database schema is outdated. Triggering a full update.")
         update_database()
 
     if is_schema_correct:
-        last_modified_time = datetime.fromtimestamp(os.path.getmtime(DB_NAME))
-        if datetime.now() - last_modified_time > timedelta(hours=UPDATE_INTERVAL_HOURS):
-            st.info("Database is older than 12 hours. Fetching fresh data...")
-            update_database()
-
-# We have REMOVED the @st.cache_data decorator from this function
-# to prevent stale data issues. Reading from SQLite is fast enough.
-def load_data_from_db():
-    """Loads all data from the SQLite database."""
-    with sqlite3.connect(DB_NAME) as conn:
-        players_df = pd.read_sql_query("SELECT * FROM players", conn)
-        history_df = pd.read_sql_query("SELECT * FROM gameweek_history", conn)
-    return players_df, history_df
+        # The refresh time is recorded in meta because WAL commits don't touch the DB file's mtime.
+        last_refresh = float(get_meta(get_conn(), 'last_refresh') or 0)
+        refresher = get_background_refresher()
+        if time.time() - last_refresh > UPDATE_INTERVAL_HOURS * 3600:
+            refresher.start()
+        if refresher.is_running():
+            st.info("Refreshing FPL data in the background. Showing the last saved data for now.")
+        elif refresher.last_error:
+            st.warning(f"The last background refresh failed: {refresher.last_error}. Showing the last saved data.")
+
+# Cached between reruns; refresh_database clears the cache once fresh data lands.
+@st.cache_data
+def load_players():
+    """Loads the players table from the SQLite database, highest scorers first.
+
+    Also returns the id-to-name map and sorted position and team options, so
+    they are built once per data load rather than on every rerun.
+    """
+    players_df = get_duckdb().cursor().execute(
+        "SELECT * FROM sqlite_scan(?, 'players') ORDER BY total_points DESC", [DB_NAME]).df()
+    players_df['display_name'] = players_df['web_name'].str.cat(players_df['team_name'], sep=' (') + ')'
+    players_df = players_df.astype({'position': 'category', 'team_name': 'category'})
+    player_map = players_df.set_index('id')['display_name']
+    positions = sorted(players_df['position'].unique())
+    teams = sorted(players_df['team_name'].unique())
+    return players_df, player_map, positions, teams
+
+@st.cache_data
+def load_history_for(player_ids):
+    """Loads gameweek history, with running point totals, for the given tuple of player ids."""
+    placeholders = ','.join('?' * len(player_ids))
+    history_df = pd.read_sql_query(
+        f"SELECT player_id, gameweek, total_points, "
+        f"SUM(total_points) OVER (PARTITION BY player_id ORDER BY gameweek) AS cumulative_points "
+        f"FROM gameweek_history WHERE player_id IN ({placeholders}) ORDER BY player_id, gameweek",
+        get_conn(), params=player_ids)
+    return history_df.astype({'player_id': 'int32', 'gameweek': 'int8',
+                              'total_points': 'int16', 'cumulative_points': 'int16'})
 
 # --- Main App Logic ---
 check_and_update_db()
 
 try:
-    players_df, history_df = load_data_from_db()
+    players_df, player_map, positions, teams = load_players()
 
     st.sidebar.header('Filters')
-    selected_position = st.sidebar.selectbox('Select Player Position', options=['All'] + sorted(players_df['position'].unique()))
-    all_teams = ['All Teams'] + sorted(players_df['team_name'].unique())
+    selected_position = st.sidebar.selectbox('Select Player Position', options=['All'] + positions)
+    all_teams = ['All Teams'] + teams
     selected_team = st.sidebar.selectbox('Select Team', options=all_teams)
 
     st.sidebar.header('Sort Players By')
@@ -172,11 +415,13 @@ try:
     sort_order = st.sidebar.radio('Order', ['Descending', 'Ascending'], index=0)
 
     # --- Filtering Logic ---
-    filtered_players_for_display = players_df.copy()
+    # position and team_name are categorical, so these comparisons run on integer codes.
+    player_mask = pd.Series(True, index=players_df.index)
     if selected_position != 'All':
-        filtered_players_for_display = filtered_players_for_display[filtered_players_for_display['position'] == selected_position]
+        player_mask &= players_df['position'] == selected_position
     if selected_team != 'All Teams':
-        filtered_players_for_display = filtered_players_for_display[filtered_players_for_display['team_name'] == selected_team]
+        player_mask &= players_df['team_name'] == selected_team
+    filtered_players_for_display = players_df[player_mask]
     
     sort_map = {
         'Total Points': 'total_points',
@@ -184,7 +429,9 @@ try:
         'Ownership (%)': 'ownership_percent'
     }
     is_ascending = sort_order == 'Ascending'
-    filtered_players_for_display = filtered_players_for_display.sort_values(by=sort_map[sort_by], ascending=is_ascending)
+    # Players are loaded already sorted by total points descending.
+    if sort_map[sort_by] != 'total_points' or is_ascending:
+        filtered_players_for_display = filtered_players_for_display.sort_values(by=sort_map[sort_by], ascending=is_ascending)
 
     st.header('Player Data Explorer')
     display_cols = ['display_name', 'position', 'cost', 'total_points', 'points_per_million', 'ownership_percent']
@@ -202,19 +449,18 @@ try:
     if player_options:
         selected_players = st.multiselect('Select players to compare:', options=player_options)
         if selected_players:
-            player_ids_to_chart = players_df[players_df['display_name'].isin(selected_players)]['id'].tolist()
+            player_ids_to_chart = tuple(sorted(int(pid) for pid in players_df[players_df['display_name'].isin(selected_players)]['id']))
             
-            chart_df_filtered = history_df[history_df['player_id'].isin(player_ids_to_chart)].copy()
-            player_map = players_df.set_index('id')['display_name']
+            chart_df_filtered = load_history_for(player_ids_to_chart)
             chart_df_filtered['Player'] = chart_df_filtered['player_id'].map(player_map)
             
-            chart_df_filtered['total_points'] = pd.to_numeric(chart_df_filtered['total_points'], errors='coerce').fillna(0)
-            
-            chart_df_filtered['Cumulative Points'] = chart_df_filtered.groupby('Player')['total_points'].cumsum()
-            
             if not chart_df_filtered.empty:
-                fig = px.line(chart_df_filtered, x='gameweek', y='Cumulative Points', color='Player',
-                              title=f'Cumulative Points Progression', markers=True)
+                fig = go.Figure()
+                for player, player_df in chart_df_filtered.groupby('Player'):
+                    fig.add_trace(go.Scattergl(x=player_df['gameweek'], y=player_df['cumulative_points'],
+                                               mode='lines+markers', name=player))
+                fig.update_layout(title='Cumulative Points Progression', xaxis_title='gameweek',
+                                  yaxis_title='Cumulative Points', legend_title='Player')
                 st.plotly_chart(fig, use_container_width=True)
 
 except Exception as e: